@@ -31,14 +31,17 @@ class Archive(AltoArchive):
     Find My Past Newspapers-compliant ALTO format.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, retain_tree=True):
         """
         Constructor
 
         :param filename: archive filename
         :type: filename: str or unicode
+        :param retain_tree: keep METS/MODS tree of each document after
+        the document is created
+        :type retain_tree: bool
         """
-        AltoArchive.__init__(self, filename)
+        AltoArchive.__init__(self, filename, retain_tree)
 
     def get_document_pattern(self):
         """
@@ -19,14 +19,18 @@ class AltoArchive(abc.ABCMeta("ABC", (object,), {})):
     of files in ALTO format.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, retain_tree=True):
         """
         Constructor
 
         :param filename: archive filename
         :type: filename: str or unicode
+        :param retain_tree: keep METS/MODS tree of each document after
+        the document is created
+        :type retain_tree: bool
         """
         self.filename = filename
+        self.retain_tree = retain_tree
         if ".zip" in self.filename:
             stream = open_stream(self.filename)
             self.zip = zipfile.ZipFile(stream)
@@ -58,7 +62,7 @@ class AltoArchive(abc.ABCMeta("ABC", (object,), {})):
         :return: Document object
         :rtype: defoe.alto.document.Document
         """
-        return Document(list(self.document_codes.keys())[index], self)
+        return Document(list(self.document_codes.keys())[index], self, self.retain_tree)
 
     def __iter__(self):
         """
@@ -68,7 +72,7 @@ class AltoArchive(abc.ABCMeta("ABC", (object,), {})):
         :rtype: defoe.alto.document.Document
         """
         for document in self.document_codes:
-            yield Document(document, self)
+            yield Document(document, self, self.retain_tree)
 
     def __len__(self):
         """
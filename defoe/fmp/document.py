@@ -5,8 +5,23 @@ of XML files in METS/MODS format.
 
 from defoe.fmp.page import Page
 
+from concurrent.futures import ThreadPoolExecutor
 from lxml import etree
+import functools
+import itertools
 import re
+import string
+
+METS_PARSER_OPTIONS = {
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "resolve_entities": False,
+    "no_network": True,
+}
+""" Parser options for METS/MODS metadata files """
+METS_PARSER = etree.XMLParser(**METS_PARSER_OPTIONS)
+""" Parser for METS/MODS metadata files """
 
 
 class Document(object):
@@ -15,60 +30,337 @@ class Document(object):
     collection of XML files in METS/MODS format.
     """
 
-    def __init__(self, code, archive):
+    __slots__ = (
+        "archive",
+        "fast_pages",
+        "code",
+        "num_pages",
+        "_page_cache",
+        "metadata",
+        "metadata_tree",
+        "title",
+        "page_codes",
+        "date",
+        "publisher",
+        "place",
+        "years",
+        "documentId",
+        "year",
+        "_articlesId",
+        "_articlesParts",
+        "_partsPage",
+        "_partsCoord",
+        "document_articles",
+    )
+    """ Document attributes. Documents have no __dict__ """
+
+    NAMESPACES = {
+        "mods": "http://www.loc.gov/mods/v3",
+        "mets": "http://www.loc.gov/METS/",
+        "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+        "premis": "info:lc/xmlns/premis-v2",
+        "dcterms": "http://purl.org/dc/terms/",
+        "fits": "http://hul.harvard.edu/ois/xml/ns/fits/fits_output",
+        "xlink": "http://www.w3.org/1999/xlink",
+    }
+    """ METS/MODS namespaces """
+    namespaces = NAMESPACES
+    """ METS/MODS namespaces, kept for existing callers """
+
+    document_type = "newspaper"
+    """ Type of document """
+    model = "fmp"
+    """ Data model of document """
+
+    # Descriptive metadata sections
+    DMD_SEC_TAG = "{http://www.loc.gov/METS/}dmdSec"
+
+    # MODS metadata elements, which live in dmdSec
+    TITLE_TAG = "{http://www.loc.gov/mods/v3}title"
+    PUBLISHER_TAG = "{http://www.loc.gov/mods/v3}publisher"
+    PLACE_TAG = "{http://www.loc.gov/mods/v3}placeTerm"
+    IDENTIFIER_TAG = "{http://www.loc.gov/mods/v3}identifier"
+    DATE_TAG = "{http://www.loc.gov/mods/v3}dateIssued"
+    MODS_TAGS = (TITLE_TAG, PUBLISHER_TAG, PLACE_TAG, IDENTIFIER_TAG, DATE_TAG)
+
+    # METS elements whose content is not used by Document, and which
+    # are discarded as they are parsed
+    UNUSED_TAGS = (
+        "{http://www.loc.gov/METS/}techMD",
+        "{http://www.loc.gov/METS/}rightsMD",
+        "{http://www.loc.gov/METS/}sourceMD",
+        "{http://www.loc.gov/METS/}digiprovMD",
+        "{http://www.loc.gov/METS/}fileSec",
+    )
+
+    # Areas of parts of each page, which live in the physical structMap
+    PARTS_AREAS_XPATH = etree.ETXPath(
+        "{http://www.loc.gov/METS/}structMap[@TYPE='PHYSICAL']"
+        "/{http://www.loc.gov/METS/}div"
+        "/{http://www.loc.gov/METS/}div[@TYPE='page']"
+        "/{http://www.loc.gov/METS/}div"
+        "/{http://www.loc.gov/METS/}fptr/*"
+    )
+
+    # IDs of articles, which live in the logical structMap
+    ARTICLES_ID_XPATH = etree.ETXPath(
+        "{http://www.loc.gov/METS/}structMap[@TYPE='LOGICAL']"
+        "/{http://www.loc.gov/METS/}div"
+        "/{http://www.loc.gov/METS/}div[@TYPE='ARTICLE']/@ID",
+        smart_strings=False,
+    )
+
+    # Links between articles and their parts, which live in structLink
+    LINK_GROUPS_XPATH = etree.ETXPath("{http://www.loc.gov/METS/}structLink/*")
+    LOCATOR_LINKS_XPATH = etree.ETXPath("{http://www.loc.gov/METS/}smLocatorLink")
+
+    # Attributes
+    XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+    XLINK_LABEL = "{http://www.w3.org/1999/xlink}label"
+
+    # Part and article IDs
+    ID_PATTERN = re.compile("[^A-Za-z0-9]+")
+    """ Characters removed from IDs """
+    ID_CHARACTERS = string.ascii_letters + string.digits
+    """ Characters kept in IDs """
+
+    # Year patterns
+    DATE_PATTERN = re.compile(
+        r"1[6-9]\d{2}[-/](?:0[1-9]|1[0-2])[-/](?:0[1-9]|[12]\d|3[01])"
+    )
+    """ Dates of form YYYY-MM-DD or YYYY/MM/DD """
+    LONG_YEAR_PATTERN = re.compile(r"1[6-9]\d\d")
+    """ Years of form 16xx to 19xx """
+    SHORT_YEAR_PATTERN = re.compile(r"\d\d")
+    """ Years of form NN """
+
+    def __init__(self, code, archive, retain_tree=True, fast_pages=False):
         """
         Constructor
 
+        If retain_tree is False then article and part information is
+        parsed when the document is created and the METS/MODS tree is
+        then released. query and single_query then parse the metadata
+        file again each time they are called.
+
         :param code: identifier for this document within an archive
         :type code: str or unicode
         :param archive: archive to which this document belongs
         :type archive: defoe.alto.archive.Archive
+        :param retain_tree: keep METS/MODS tree after construction
+        :type retain_tree: bool
+        :param fast_pages: read pages in a single streaming pass,
+        parsing their trees only if needed (see defoe.fmp.page.Page)
+        :type fast_pages: bool
         """
-        self.namespaces = {
-            "mods": "http://www.loc.gov/mods/v3",
-            "mets": "http://www.loc.gov/METS/",
-            "xsi": "http://www.w3.org/2001/XMLSchema-instance",
-            "premis": "info:lc/xmlns/premis-v2",
-            "dcterms": "http://purl.org/dc/terms/",
-            "fits": "http://hul.harvard.edu/ois/xml/ns/fits/fits_output",
-            "xlink": "http://www.w3.org/1999/xlink",
-        }
         self.archive = archive
+        self.fast_pages = fast_pages
         self.code = code
         self.num_pages = 0
+        self._page_cache = {}
         self.metadata = self.archive.open_document(self.code)
-        self.metadata_tree = etree.parse(self.metadata)
-        self.title = self.single_query("//mods:title/text()")
+        self.metadata_tree = self.parse_metadata()
+        mods = self.parse_mods()
+        self.title = mods.get(Document.TITLE_TAG)
         self.page_codes = sorted(
             self.archive.document_codes[self.code], key=Document.sorter
         )
         self.num_pages = len(self.page_codes)
-        self.years = Document.parse_year(self.single_query("//mods:dateIssued/text()"))
-        self.publisher = self.single_query("//mods:publisher/text()")
-        self.place = self.single_query("//mods:placeTerm/text()")
-        # place may often have a year in.
-        self.years += Document.parse_year(self.place)
-        self.years = sorted(self.years)
-        self.documentId = self.single_query("//mods:identifier/text()")
+        self.date = mods.get(Document.DATE_TAG)
+        self.publisher = mods.get(Document.PUBLISHER_TAG)
+        self.place = mods.get(Document.PLACE_TAG)
+        self.years = Document.get_years(self.date, self.place)
+        self.documentId = mods.get(Document.IDENTIFIER_TAG)
         if self.years:
             self.year = self.years[0]
         else:
             self.year = None
-        self.date = self.single_query("//mods:dateIssued/text()")
-        self.document_type = "newspaper"
-        self.model = "fmp"
-
-        #### New ############
-        # [art0001, art0002, art0003]
-        self.articlesId = self.parse_structMap_Logical()
-        # {'#art0001':['#pa0001001', '#pa0001002', '#pa0001003', '#pa0001004', '#pa0001005', '#pa0001006', '#pa0001007'], '#art0002': ['#pa0001008', '#pa0001009' ..]}
-        # {'pa0001001': 'page1 area1', 'pa0001003': 'page1 area3'}
-        self.articlesParts, self.partsPage = self.parse_structLink()
-        # {'pa0001001': ['RECT', '1220,5,2893,221'], 'pa0001003': ['RECT', '2934,14,3709,211'], 'pa0004044': ['RECT', '5334,2088,5584,2121']}
-        self.partsCoord = self.parse_structMap_Physical()
-        self.num_articles = len(self.articlesId)
+
+        # Article and part information is parsed from the structMaps
+        # and structLink, all together, the first time any of it is
+        # needed.
+        self._articlesId = None
+        self._articlesParts = None
+        self._partsPage = None
+        self._partsCoord = None
+        self.document_articles = None
+        if not retain_tree:
+            self.parse_structure()
+            self.metadata_tree = None
         #######################
 
+    def parse_structure(self):
+        """
+        Parse the structMaps and structLink, saving the article and
+        part information in attributes in a single pass over the
+        METS structure.
+        """
+        self._articlesId = self.parse_structMap_Logical()
+        self._articlesParts, self._partsPage = self.parse_structLink()
+        self._partsCoord = self.parse_structMap_Physical()
+
+    @property
+    def articlesId(self):
+        """
+        Gets IDs of articles in document. These are then saved in an
+        attribute, so the structure is only parsed once.
+
+        :return: article IDs e.g. ['art0001', 'art0002', 'art0003']
+        :rtype: list(str or unicode)
+        """
+        if self._articlesId is None:
+            self.parse_structure()
+        return self._articlesId
+
+    @property
+    def articlesParts(self):
+        """
+        Gets IDs of the parts of each article or other element in
+        document. These are then saved in an attribute, so the
+        structure is only parsed once.
+
+        :return: part IDs per article e.g.
+        {'art0001': ['pa0001001', 'pa0001002', ...], 'art0002': ['pa0001008', ...]}
+        :rtype: dict
+        """
+        if self._articlesParts is None:
+            self.parse_structure()
+        return self._articlesParts
+
+    @property
+    def partsPage(self):
+        """
+        Gets page and area of each part in document. These are then
+        saved in an attribute, so the structure is only parsed once.
+
+        :return: page and area per part e.g.
+        {'pa0001001': 'page1 area1', 'pa0001003': 'page1 area3'}
+        :rtype: dict
+        """
+        if self._partsPage is None:
+            self.parse_structure()
+        return self._partsPage
+
+    @property
+    def partsCoord(self):
+        """
+        Gets shape and coordinates of each part in document. These
+        are then saved in an attribute, so the structure is only
+        parsed once.
+
+        :return: shape and coordinates per part e.g.
+        {'pa0001001': ['RECT', '1220,5,2893,221'], 'pa0001003': ['RECT', '2934,14,3709,211']}
+        :rtype: dict
+        """
+        if self._partsCoord is None:
+            self.parse_structure()
+        return self._partsCoord
+
+    @property
+    def num_articles(self):
+        """
+        Gets number of articles in document.
+
+        :return: number of articles
+        :rtype: int
+        """
+        return len(self.articlesId)
+
+    @staticmethod
+    def get_years(date, place):
+        """
+        Get years from the date and place of a document. The place
+        may often have a year in.
+
+        :param date: date
+        :type date: str or unicode
+        :param place: place
+        :type place: str or unicode
+        :return: years
+        :rtype: list(int)
+        """
+        return sorted(Document.parse_year(date) + Document.parse_year(place))
+
+    @classmethod
+    def batch_metadata(cls, archive, codes=None):
+        """
+        Get the title, publisher, place, date and identifier of
+        documents in an archive, without creating Document objects.
+
+        Each METS/MODS metadata file is parsed incrementally and only
+        until the MODS elements have been found, so no metadata tree
+        is built.
+
+        :param archive: archive to which the documents belong
+        :type archive: defoe.fmp.archive.Archive
+        :param codes: document codes, or None for all documents in
+        the archive
+        :type codes: list(str or unicode)
+        :return: one dictionary per document, with keys code, title,
+        publisher, place, date, documentId, years, year, page_codes and
+        num_pages
+        :rtype: list(dict)
+        """
+        if codes is None:
+            codes = list(archive.document_codes)
+        documents = []
+        for code in codes:
+            mods = cls.read_mods(archive.open_document(code))
+            date = mods.get(cls.DATE_TAG)
+            place = mods.get(cls.PLACE_TAG)
+            years = cls.get_years(date, place)
+            page_codes = sorted(archive.document_codes[code], key=cls.sorter)
+            documents.append(
+                {
+                    "code": code,
+                    "title": mods.get(cls.TITLE_TAG),
+                    "publisher": mods.get(cls.PUBLISHER_TAG),
+                    "place": place,
+                    "date": date,
+                    "documentId": mods.get(cls.IDENTIFIER_TAG),
+                    "years": years,
+                    "year": years[0] if years else None,
+                    "page_codes": page_codes,
+                    "num_pages": len(page_codes),
+                }
+            )
+        return documents
+
+    @staticmethod
+    def read_mods(stream):
+        """
+        Get the text of the first title, publisher, placeTerm,
+        identifier and dateIssued MODS elements with text in the
+        dmdSecs of a METS/MODS metadata file. Elements with no text
+        are skipped. The file is parsed incrementally, every element is
+        discarded once it has been parsed, and parsing stops once all
+        the elements have been found.
+
+        :param stream: METS/MODS metadata file
+        :type stream: file-like object
+        :return: text of each element found, keyed by element tag
+        :rtype: dict
+        """
+        mods = {}
+        context = etree.iterparse(stream, events=("end",), **METS_PARSER_OPTIONS)
+        for _, element in context:
+            tag = element.tag
+            if (
+                tag in Document.MODS_TAGS
+                and element.text
+                and tag not in mods
+                and next(element.iterancestors(Document.DMD_SEC_TAG), None) is not None
+            ):
+                mods[tag] = element.text
+                if len(mods) == len(Document.MODS_TAGS):
+                    break
+            # Ancestors are still being parsed, so only the element and
+            # its preceding siblings can be discarded.
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        return mods
+
     @staticmethod
     def parse_year(text):
         """
@@ -87,63 +379,118 @@ class Document(object):
         * "1873-80" returns [1873, 1880]
         * "1870-09-01" returns [1870]
 
+        Years are cached by text, as the same dates and places recur
+        across documents.
+
         :param text: text to parse
         :type text: str or unicode
         :return: years
         :rtype: set(int)
         """
+        if not text:
+            return []
         try:
-            date_pattern = re.compile(
-                "(1[6-9]\d{2}(-|/)(0[1-9]|1[0-2])(-|/)(0[1-9]|[12]\d|3[01]))"
-            )
-            if date_pattern.match(text):
-                return [int(text[0:4])]
-            long_pattern = re.compile("(1[6-9]\d\d)")
-            short_pattern = re.compile("\d\d")
-            results = []
-            chunks = iter(long_pattern.split(text)[1:])
-            for year, rest in zip(chunks, chunks):
-                results.append(int(year))
-                century = year[0:2]
-                short_years = short_pattern.findall(rest)
-                for short_year in short_years:
-                    results.append(int(century + short_year))
-            return sorted(set(results))
+            return list(Document._parse_year(text))
         except TypeError:
             return []
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_year(text):
+        """
+        Parse text to extract years of form 16xx to 19xx. See
+        parse_year.
+
+        :param text: text to parse
+        :type text: str or unicode
+        :return: years, in ascending order
+        :rtype: tuple(int)
+        """
+        if Document.DATE_PATTERN.match(text):
+            return (int(text[0:4]),)
+        results = set()
+        years = list(Document.LONG_YEAR_PATTERN.finditer(text))
+        for index, year_match in enumerate(years):
+            year = year_match.group(0)
+            results.add(int(year))
+            century = year[0:2]
+            # Short years run from the end of this year to the
+            # start of the next one.
+            if index + 1 < len(years):
+                end = years[index + 1].start()
+            else:
+                end = len(text)
+            for short_year in Document.SHORT_YEAR_PATTERN.finditer(
+                text, year_match.end(), end
+            ):
+                results.add(int(century + short_year.group(0)))
+        return tuple(sorted(results))
+
+    @staticmethod
+    def clean_id(idstring):
+        """
+        Remove all non-alphanumeric characters from an ID. For
+        example, given "#pa0001001", return "pa0001001".
+
+        IDs are usually alphanumeric with a "#" prefix, so this is
+        checked first with string operations, and only other IDs are
+        cleaned using a regular expression.
+
+        :param idstring: ID
+        :type idstring: str or unicode
+        :return: ID with only alphanumeric characters
+        :rtype: str or unicode
+        """
+        cleaned = idstring.lstrip("#")
+        if cleaned.strip(Document.ID_CHARACTERS):
+            cleaned = Document.ID_PATTERN.sub("", idstring)
+        return cleaned
+
     @staticmethod
     def sorter(page_code):
         """
         Given a page code of form [0-9]*(_[0-9]*), split this
         into the sub-codes. For example, given 123_456, return
-        [123, 456]
+        (123, 456)
 
         :param page_code: page code
         :type page_code: str or unicode
-        :return: list of page codes
-        :rtype: list(int)
+        :return: page codes
+        :rtype: tuple(int)
         """
-        codes = list(map(int, page_code.split("_")))
-        return codes
+        return tuple(map(int, page_code.split("_")))
 
     def query(self, query):
         """
-        Run XPath query.
+        Run XPath query. Query strings are compiled once, with the
+        METS/MODS namespaces, and the compiled query reused by later
+        calls.
+
+        Queries are run over metadata_tree, in which the elements in
+        UNUSED_TAGS have no content. If metadata_tree has been
+        released (see retain_tree in __init__) then the metadata file
+        is parsed again, in the same way, for each query, and that
+        tree is discarded once the query has run. This costs a parse
+        of the file per query but keeps no tree in memory.
 
         :param query: XPath query
-        :type query: str or unicode
+        :type query: str or unicode or lxml.etree.XPath
         :return: list of query results or None if none
         :rtype: list(lxml.etree.<MODULE>) (depends on query)
         """
-        return self.metadata_tree.xpath(query, namespaces=self.namespaces)
+        if isinstance(query, str):
+            query = compile_query(query)
+        tree = self.metadata_tree
+        if tree is None:
+            tree = self.parse_metadata(self.archive.open_document(self.code))
+        return query(tree)
 
     def single_query(self, query):
         """
         Run XPath query and return first result.
 
         :param query: XPath query
-        :type query: str or unicode
+        :type query: str or unicode or lxml.etree.XPath
         :return: query result or None if none
         :rtype: str or unicode
         """
@@ -152,16 +499,98 @@ class Document(object):
             return None
         return str(result[0])
 
+    def parse_metadata(self, stream=None):
+        """
+        Parse the METS/MODS metadata file. The file is parsed
+        incrementally and the content of each element in UNUSED_TAGS
+        (administrative metadata and file lists) is discarded as soon
+        as it has been parsed, so the tree only keeps the descriptive
+        metadata, structMaps and structLink.
+
+        :param stream: METS/MODS metadata file. If None then the
+        document's metadata file, opened on construction, is used
+        :type stream: file-like object
+        :return: metadata tree
+        :rtype: lxml.etree._ElementTree
+        """
+        if stream is None:
+            stream = self.metadata
+        context = etree.iterparse(
+            stream, events=("end",), tag=Document.UNUSED_TAGS, **METS_PARSER_OPTIONS
+        )
+        for _, element in context:
+            element.clear()
+        return etree.ElementTree(context.root)
+
+    def parse_mods(self):
+        """
+        Get the text of the first title, publisher, placeTerm,
+        identifier and dateIssued MODS elements with text in the
+        document's dmdSecs, in a single walk over the dmdSecs. Elements
+        with no text are skipped.
+
+        :return: text of each element found, keyed by element tag
+        :rtype: dict
+        """
+        mods = {}
+        for dmd_sec in self.metadata_tree.iterfind(Document.DMD_SEC_TAG):
+            for element in dmd_sec.iter(*Document.MODS_TAGS):
+                if element.text and element.tag not in mods:
+                    mods[element.tag] = element.text
+        return mods
+
     def page(self, code):
         """
-        Given a page code, return a new Page object.
+        Given a page code, return a Page object. Pages are created,
+        and their XML parsed, the first time they are requested and
+        then saved, so subsequent requests return the same object.
 
         :param code: page code
         :type code: str or unicode
         :return: Page object
-        :rtype: defoe.alto.page.Page
+        :rtype: defoe.fmp.page.Page
+        """
+        page = self._page_cache.get(code)
+        if page is None:
+            page = Page(self, code, fast=self.fast_pages)
+            self._page_cache[code] = page
+        return page
+
+    def load_pages(self, max_workers=None):
+        """
+        Create Page objects for all pages in the document that have
+        not yet been requested, parsing their XML concurrently in a
+        pool of threads. lxml releases the GIL while it parses, so
+        this can overlap reading and parsing of pages for documents
+        with many pages. Subsequent page requests, including
+        iteration, return the saved Page objects.
+
+        :param max_workers: maximum number of threads. If None then
+        the number of pages to load, up to 8, is used
+        :type max_workers: int
+        """
+        codes = [code for code in self.page_codes if code not in self._page_cache]
+        if not codes:
+            return
+        if max_workers is None:
+            max_workers = min(8, len(codes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(
+                lambda code: Page(self, code, fast=self.fast_pages), codes
+            )
+            for code, page in zip(codes, pages):
+                self._page_cache[code] = page
+
+    def release_page(self, code):
         """
-        return Page(self, code)
+        Discard the saved Page object for a page code, if any, so its
+        XML can be garbage collected. The page is created again if it
+        is subsequently requested.
+
+        :param code: page code
+        :type code: str or unicode
+        """
+        self._page_cache.pop(code, None)
 
     def get_document_info(self):
         """
@@ -187,21 +616,25 @@ class Document(object):
 
     def __getitem__(self, index):
         """
-        Given a page index, return a new Page object.
+        Given a page index, return its Page object. Page objects are
+        saved and reused, as for page, until released with
+        release_page.
 
         :param index: page index
         :type index: int
         :return: Page object
-        :rtype: defoe.alto.page.Page
+        :rtype: defoe.fmp.page.Page
         """
         return self.page(self.page_codes[index])
 
     def __iter__(self):
         """
-        Iterate over page codes, returning new Page objects.
+        Iterate over page codes, returning their Page objects. Page
+        objects are saved and reused, as for page, until released with
+        release_page.
 
         :return: Page object
-        :rtype: defoe.alto.page.Page
+        :rtype: defoe.fmp.page.Page
         """
         for page_code in self.page_codes:
             yield self.page(page_code)
@@ -250,28 +683,41 @@ class Document(object):
             for wc in page.wc:
                 yield page, wc
 
+    def scan_word_records(self):
+        """
+        Iterate over words in pages together with their word and
+        character confidences, in a single traversal of each page.
+
+        :return: page, word, wc and cc
+        :rtype: tuple(defoe.fmp.page.Page, str or unicode, str or
+        unicode, str or unicode)
+        """
+        for page in self:
+            for word, wc, cc in page.iter_word_records():
+                yield page, word, wc, cc
+
     @property
     def articles(self):
         """
-        Iterate calculates the articles in each page.
+        Iterate calculates the articles in each page. These are then
+        saved in an attribute, so the articles are only calculated once.
 
         :return: a dictionary per page with all the articles. Each articles is conformed by one or more textblocks
         :rtype: dictionary of articles. Each 
         {'art0001': ['pa0001001': ['RECT', '1220,5,2893,221', 'page1 area1'], 'pa0001003': ['RECT', '2934,14,3709,211', page1 area3], ...]], ...} 
         """
+        if self.document_articles is not None:
+            return self.document_articles
         self.document_articles = {}
-        articlesInfo = self.articles_info()
-        for page in self:
-            for tb in page.tb:
-                for articleId in articlesInfo:
-                    for partId in articlesInfo[articleId]:
-                        if partId == tb.textblock_id:
-                            if articleId not in self.document_articles:
-                                self.document_articles[articleId] = []
-                            tb.textblock_shape = articlesInfo[articleId][partId][0]
-                            tb.textblock_coords = articlesInfo[articleId][partId][1]
-                            tb.textblock_page_area = articlesInfo[articleId][partId][2]
-                            self.document_articles[articleId].append(tb)
+        partsInfo = self.parts_info()
+        for tb in self.tb():
+            for articleId, shape, coords, page_area in partsInfo.get(
+                tb.textblock_id, []
+            ):
+                tb.textblock_shape = shape
+                tb.textblock_coords = coords
+                tb.textblock_page_area = page_area
+                self.document_articles.setdefault(articleId, []).append(tb)
 
         return self.document_articles
 
@@ -304,8 +750,7 @@ class Document(object):
         :return: string
         :rtype: str or unicode
         """
-        for _, string in self.scan_strings():
-            yield string
+        return itertools.chain.from_iterable(page.strings for page in self)
 
     def tb(self):
         """
@@ -314,8 +759,7 @@ class Document(object):
         :return: string
         :rtype: str or unicode
         """
-        for _, tb in self.scan_tb():
-            yield tb
+        return itertools.chain.from_iterable(page.tb for page in self)
 
     def words(self):
         """
@@ -324,8 +768,7 @@ class Document(object):
         :return: word
         :rtype: str or unicode
         """
-        for _, word in self.scan_words():
-            yield word
+        return itertools.chain.from_iterable(page.words for page in self)
 
     def images(self):
         """
@@ -334,8 +777,7 @@ class Document(object):
         :return: XML fragment with image
         :rtype: lxml.etree._Element
         """
-        for _, image in self.scan_images():
-            yield image
+        return itertools.chain.from_iterable(page.images for page in self)
 
     def wc(self):
         """
@@ -344,8 +786,7 @@ class Document(object):
         :return: wc
         :rtype: str or unicode
         """
-        for _, wc in self.scan_wc():
-            yield wc
+        return itertools.chain.from_iterable(page.wc for page in self)
 
     def cc(self):
         """
@@ -354,8 +795,17 @@ class Document(object):
         :return: wc
         :rtype: str or unicode
         """
-        for _, cc in self.scan_cc():
-            yield cc
+        return itertools.chain.from_iterable(page.cc for page in self)
+
+    def word_records(self):
+        """
+        Iterate over words with their word and character qualities.
+
+        :return: word, wc and cc
+        :rtype: tuple(str or unicode, str or unicode, str or unicode)
+        """
+        for _, word, wc, cc in self.scan_word_records():
+            yield word, wc, cc
 
     def parse_structMap_Physical(self):
         """
@@ -365,20 +815,10 @@ class Document(object):
         {'pa0001001': ['RECT', '1220,5,2893,221'], 'pa0001003': ['RECT', '2934,14,3709,211'], 'pa0004044': ['RECT', '5334,2088,5584,2121']}
         """
         partsCoord = dict()
-        elem = self.metadata_tree.find(
-            'mets:structMap[@TYPE="PHYSICAL"]', self.namespaces
-        )
-        for physic in elem:
-            parts = physic.findall('mets:div[@TYPE="page"]', self.namespaces)
-            for part in parts:
-                metadata_parts = part.findall("mets:div", self.namespaces)
-                for metadata in metadata_parts:
-                    fptr = metadata.find("mets:fptr", self.namespaces)
-                    for fp in fptr:
-                        partsCoord[list(metadata.values())[0]] = [
-                            list(fp.values())[1],
-                            list(fp.values())[2],
-                        ]
+        for fp in Document.PARTS_AREAS_XPATH(self.metadata_tree.getroot()):
+            # area -> fptr -> part div
+            part = fp.getparent().getparent()
+            partsCoord[part.get("ID")] = [fp.get("SHAPE"), fp.get("COORDS")]
         return partsCoord
 
     def parse_structMap_Logical(self):
@@ -388,15 +828,7 @@ class Document(object):
         :rtype: list
         [art0001, art0002, art0003]
         """
-        articlesId = []
-        elem = self.metadata_tree.find(
-            'mets:structMap[@TYPE="LOGICAL"]', self.namespaces
-        )
-        for logic in elem:
-            articles = logic.findall('mets:div[@TYPE="ARTICLE"]', self.namespaces)
-            for article in articles:
-                articlesId.append(list(article.values())[0])
-        return articlesId
+        return Document.ARTICLES_ID_XPATH(self.metadata_tree.getroot())
 
     def parse_structLink(self):
         """
@@ -407,20 +839,20 @@ class Document(object):
         {'#art0001':['#pa0001001', '#pa0001002', '#pa0001003', '#pa0001004', '#pa0001005', '#pa0001006', '#pa0001007'], '#art0002': ['#pa0001008', '#pa0001009' ..]}
         {'pa0001001': 'page1 area1', 'pa0001003': 'page1 area3'}
         """
-        articlesId = []
         articlesParts = dict()
         partsPage = dict()
-        elem = self.metadata_tree.findall("mets:structLink", self.namespaces)
-        for smlinkgrp in elem:
-            parts = smlinkgrp.findall("mets:smLinkGrp", self.namespaces)
-            for linklocator in smlinkgrp:
-                linkl = linklocator.findall("mets:smLocatorLink", self.namespaces)
-                article_parts = []
-                for link in linkl:
-                    idstring = list(link.values())[0]
-                    partId = re.sub("[^A-Za-z0-9]+", "", idstring)
-                    article_parts.append(partId)
-                    partsPage[partId] = list(link.values())[1]
+        # Bind names used for every locator link
+        clean_id = Document.clean_id
+        locator_links = Document.LOCATOR_LINKS_XPATH
+        href = Document.XLINK_HREF
+        label = Document.XLINK_LABEL
+        for linklocator in Document.LINK_GROUPS_XPATH(self.metadata_tree.getroot()):
+            article_parts = []
+            for link in locator_links(linklocator):
+                partId = clean_id(link.get(href))
+                article_parts.append(partId)
+                partsPage[partId] = link.get(label)
+            if article_parts:
                 articlesParts[article_parts[0]] = article_parts[1:]
         return articlesParts, partsPage
 
@@ -430,13 +862,38 @@ class Document(object):
         :rtype: dictionary
         #{'art0001 {'pa0001001': ['RECT', '1220,5,2893,221', 'page1 area1'], 'pa0001003': ['RECT', '2934,14,3709,211', 'page1 area3'], ....}}
         """
-        articlesId = []
-        articlesInfo = dict()
+        articlesInfo = {a_id: dict() for a_id in self.articlesId}
+        for p_id, parts in self.parts_info().items():
+            for a_id, shape, coords, page_area in parts:
+                articlesInfo[a_id][p_id] = [shape, coords, page_area]
+        return articlesInfo
+
+    def parts_info(self):
+        """
+        :return: create a dictionary, with parts/textblocks IDs as keys. Each entry has a list with, for each article the part belongs to, the article ID and the part information (shape, coords and page_area).
+        :rtype: dictionary
+        {'pa0001001': [('art0001', 'RECT', '1220,5,2893,221', 'page1 area1')], 'pa0001003': [('art0001', 'RECT', '2934,14,3709,211', 'page1 area3')], ....}
+        """
+        partsInfo = dict()
         for a_id in self.articlesId:
-            articlesInfo[a_id] = dict()
             for p_id in self.articlesParts[a_id]:
                 if p_id in self.partsCoord:
-                    self.partsCoord[p_id].append(self.partsPage[p_id])
-                    articlesInfo[a_id][p_id] = self.partsCoord[p_id]
-        return articlesInfo
+                    shape, coords = self.partsCoord[p_id]
+                    partsInfo.setdefault(p_id, []).append(
+                        (a_id, shape, coords, self.partsPage[p_id])
+                    )
+        return partsInfo
+
 
+@functools.lru_cache(maxsize=128)
+def compile_query(query):
+    """
+    Compile XPath query using the METS/MODS namespaces. Compiled
+    queries are cached, so each query string is only compiled once.
+
+    :param query: XPath query
+    :type query: str or unicode
+    :return: compiled query
+    :rtype: lxml.etree.XPath
+    """
+    return etree.XPath(query, namespaces=Document.NAMESPACES)
@@ -6,6 +6,36 @@ METS/MODS format.
 from defoe.fmp.textblock import TextBlock
 
 from lxml import etree
+import threading
+
+PAGE_PARSER_OPTIONS = {
+    "collect_ids": False,
+    "huge_tree": True,
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "resolve_entities": False,
+    "no_network": True,
+}
+""" Parser options for ALTO page files """
+
+parsers = threading.local()
+""" Parser for ALTO page files in each thread """
+
+
+def get_parser():
+    """
+    Gets parser for ALTO page files for the current thread. Parsers
+    are reused, but are not shared between threads as lxml parsers
+    are not thread-safe.
+
+    :return: parser
+    :rtype: lxml.etree.XMLParser
+    """
+    parser = getattr(parsers, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(**PAGE_PARSER_OPTIONS)
+        parsers.parser = parser
+    return parser
 
 
 class Page(object):
@@ -14,20 +44,57 @@ class Page(object):
     in METS/MODS format.
     """
 
+    __slots__ = (
+        "code",
+        "document_code",
+        "archive",
+        "tree",
+        "page_tree",
+        "width",
+        "height",
+        "pc",
+        "page_words",
+        "page_strings",
+        "page_images",
+        "page_wc",
+        "page_cc",
+        "page_blocks_id",
+        "page_tb",
+        "page_content",
+    )
+    """ Page attributes. Pages have no __dict__ """
+
     # XPath Queries
-    WORDS_XPATH = etree.XPath("//String/@CONTENT")  # String content
-    STRINGS_XPATH = etree.XPath("//String")  # String elements
-    IMAGES_XPATH = etree.XPath("//GraphicalElement")  # Graphical elements
     PAGE_XPATH = etree.XPath("//Page")  # Page
-    WC_XPATH = etree.XPath("//String/@WC")  # Word confidence content
-    CC_XPATH = etree.XPath("//String/@CC")  # Character confience content
-    TB_XPATH_ID = etree.XPath("//TextBlock/@ID")  # Textblock ID
-    TB_XPATH = etree.XPath("//TextBlock")  # Textblock content
+    PAGE_PATH = ".//Page"  # Page, as ElementPath, stopping at first match
+    # XPath Queries relative to Page
+    WORDS_XPATH = etree.XPath(".//String/@CONTENT")  # String content
+    STRINGS_XPATH = etree.XPath(".//String")  # String elements
+    IMAGES_XPATH = etree.XPath(".//GraphicalElement")  # Graphical elements
+    WC_XPATH = etree.XPath(".//String/@WC")  # Word confidence content
+    CC_XPATH = etree.XPath(".//String/@CC")  # Character confience content
+    TB_XPATH_ID = etree.XPath(".//TextBlock/@ID")  # Textblock ID
+    TB_XPATH = etree.XPath(".//TextBlock")  # Textblock content
+
+    # Elements read by fast_load
+    FAST_LOAD_TAGS = ("Page", "TextBlock", "String")
+    # Elements read by fast_load for page metadata only
+    METADATA_TAGS = ("Page", "TextBlock")
 
-    def __init__(self, document, code, source=None):
+    def __init__(self, document, code, source=None, fast=False, metadata_only=False):
         """
         Constructor.
 
+        If fast is True then the page is read in a single streaming
+        pass which collects its dimensions, words, word and character
+        confidences and textblock IDs, without building a tree. The
+        tree is parsed, from the archive, only if strings, textblocks,
+        images or queries are then requested.
+
+        If metadata_only is True then the page is read in the same way
+        but only its dimensions and textblock IDs are collected. Words
+        and confidences are then read from the tree, if requested.
+
         :param document: Document object corresponding to document to
         which this page belongs
         :type document: defoe.alto.document.Document
@@ -36,25 +103,96 @@ class Page(object):
         :param source: stream. If None then an attempt is made to
         open the file holding the page via the given "document"
         :type source: zipfile.ZipExt or another file-like object
+        :param fast: read page without building a tree
+        :type fast: bool
+        :param metadata_only: read page dimensions and textblock IDs
+        only, without building a tree
+        :type metadata_only: bool
         """
         if not source:
             source = document.archive.open_page(document.code, code)
         self.code = code
-        self.tree = etree.parse(source)
-        self.page_tree = self.single_query(Page.PAGE_XPATH)
-        self.width = int(self.page_tree.get("WIDTH"))
-        self.height = int(self.page_tree.get("HEIGHT"))
-        self.pc = self.page_tree.get("PC")
+        self.document_code = document.code
+        self.archive = document.archive
         self.page_words = None
         self.page_strings = None
         self.page_images = None
         self.page_wc = None
         self.page_cc = None
         self.page_blocks_id = None
-        self.tb = [
-            TextBlock(tb, document.code, code) for tb in self.query(Page.TB_XPATH)
-        ]
-        # self.page_tb = None
+        self.page_tb = None
+        self.page_content = None
+        self.tree = None
+        self.page_tree = None
+        if metadata_only:
+            self.fast_load(source, Page.METADATA_TAGS)
+        elif fast:
+            self.fast_load(source)
+        else:
+            self.parse_tree(source)
+            self.width = int(self.page_tree.get("WIDTH"))
+            self.height = int(self.page_tree.get("HEIGHT"))
+            self.pc = self.page_tree.get("PC")
+
+    def parse_tree(self, source=None):
+        """
+        Parse page and find its Page element.
+
+        :param source: stream. If None then the file holding the page
+        is opened via the archive
+        :type source: zipfile.ZipExt or another file-like object
+        """
+        if not source:
+            source = self.archive.open_page(self.document_code, self.code)
+        self.tree = etree.parse(source, get_parser())
+        self.page_tree = self.tree.find(Page.PAGE_PATH)
+
+    def fast_load(self, source, tags=FAST_LOAD_TAGS):
+        """
+        Read page dimensions, words, word confidences (wc), character
+        confidences (cc) and textblock IDs in a single streaming pass,
+        discarding each element once it has been read. Words and
+        confidences are only read if "String" is in tags.
+
+        :param source: stream
+        :type source: zipfile.ZipExt or another file-like object
+        :param tags: elements to read
+        :type tags: tuple(str or unicode)
+        """
+        words = []
+        wc = []
+        cc = []
+        blocks_id = []
+        self.width = None
+        self.height = None
+        self.pc = None
+        for _, element in etree.iterparse(
+            source, events=("end",), tag=tags, **PAGE_PARSER_OPTIONS
+        ):
+            if element.tag == "String":
+                content = element.get("CONTENT")
+                if content is not None:
+                    words.append(content)
+                confidence = element.get("WC")
+                if confidence is not None:
+                    wc.append(confidence)
+                confidence = element.get("CC")
+                if confidence is not None:
+                    cc.append(confidence)
+            elif element.tag == "TextBlock":
+                block_id = element.get("ID")
+                if block_id is not None:
+                    blocks_id.append(block_id)
+            elif self.width is None:
+                self.width = int(element.get("WIDTH"))
+                self.height = int(element.get("HEIGHT"))
+                self.pc = element.get("PC")
+            element.clear()
+        if "String" in tags:
+            self.page_words = words
+            self.page_wc = wc
+            self.page_cc = cc
+        self.page_blocks_id = blocks_id
 
     def query(self, xpath_query):
         """
@@ -65,6 +203,8 @@ class Page(object):
         :return: list of query results or None if none
         :rtype: list(lxml.etree.<MODULE>) (depends on query)
         """
+        if self.tree is None:
+            self.parse_tree()
         return xpath_query(self.tree)
 
     def single_query(self, xpath_query):
@@ -90,8 +230,8 @@ class Page(object):
         :return: words
         :rtype: list(str or unicode)
         """
-        if not self.page_words:
-            self.page_words = list(map(str, self.query(Page.WORDS_XPATH)))
+        if self.page_words is None:
+            self.parse_strings()
         return self.page_words
 
     @property
@@ -103,9 +243,8 @@ class Page(object):
         :return: wc
         :rtype: list(str)
         """
-        if not self.page_wc:
-            self.page_wc = list(self.query(Page.WC_XPATH))
-
+        if self.page_wc is None:
+            self.parse_strings()
         return self.page_wc
 
     @property
@@ -117,9 +256,8 @@ class Page(object):
         :return: cc
         :rtype: list(str)
         """
-        if not self.page_cc:
-            self.page_cc = list(self.query(Page.CC_XPATH))
-
+        if self.page_cc is None:
+            self.parse_strings()
         return self.page_cc
 
     @property
@@ -131,21 +269,96 @@ class Page(object):
         :return: strings
         :rtype: list(lxml.etree._ElementStringResult)
         """
-        if not self.page_strings:
-            self.page_strings = self.query(Page.STRINGS_XPATH)
+        if self.page_strings is None:
+            self.parse_strings()
         return self.page_strings
 
+    def parse_strings(self):
+        """
+        Get all strings in page and their words, word confidences
+        (wc) and character confidences (cc), visiting each String
+        element once. These are then saved in attributes.
+        """
+        if self.tree is None:
+            self.parse_tree()
+        strings = Page.STRINGS_XPATH(self.page_tree)
+        words = []
+        wc = []
+        cc = []
+        for string in strings:
+            content = string.get("CONTENT")
+            if content is not None:
+                words.append(content)
+            confidence = string.get("WC")
+            if confidence is not None:
+                wc.append(confidence)
+            confidence = string.get("CC")
+            if confidence is not None:
+                cc.append(confidence)
+        self.page_strings = strings
+        self.page_words = words
+        self.page_wc = wc
+        self.page_cc = cc
+
+    def iter_word_records(self):
+        """
+        Iterate over words in page together with their word and
+        character confidences, visiting each String element once.
+
+        If the words and confidences have already been read, for
+        example by a page created with fast True, and every String has
+        all three, they are used and the tree is not parsed.
+
+        :return: word, word confidence and character confidence
+        :rtype: tuple(str or unicode, str or unicode, str or unicode)
+        """
+        words, wc, cc = self.page_words, self.page_wc, self.page_cc
+        if words is not None and len(words) == len(wc) == len(cc):
+            yield from zip(words, wc, cc)
+            return
+        for string in self.strings:
+            yield string.get("CONTENT"), string.get("WC"), string.get("CC")
+
+    @property
+    def tb(self):
+        """
+        Gets all textblocks in page. These are then saved in an
+        attribute, so the textblocks are only retrieved once.
+
+        :return: textblocks
+        :rtype: list(defoe.fmp.textblock.TextBlock)
+        """
+        if self.page_tb is None:
+            if self.tree is None:
+                self.parse_tree()
+            self.page_tb = [
+                TextBlock(tb, self.document_code, self.code)
+                for tb in Page.TB_XPATH(self.page_tree)
+            ]
+        return self.page_tb
+
     @property
     def textblock_ids(self):
         """
-        Gets all strings in page. These are then saved in an attribute,
-        so the strings are only retrieved once.
+        Gets IDs of all textblocks in page. These are then saved in an
+        attribute, so the IDs are only retrieved once. If the
+        textblocks have already been retrieved then their IDs are
+        used, rather than querying the page again.
 
-        :return: strings
-        :rtype: list(lxml.etree._ElementStringResult)
+        :return: textblock IDs
+        :rtype: list(str or unicode)
         """
-        if not self.page_blocks_id:
-            self.page_blocks_id = list(self.query(Page.TB_XPATH_ID))
+        if self.page_blocks_id is None:
+            if self.page_tb is not None:
+                self.page_blocks_id = [
+                    tb.textblock_id
+                    for tb in self.page_tb
+                    if tb.textblock_id is not None
+                ]
+            else:
+                if self.tree is None:
+                    self.parse_tree()
+                self.page_blocks_id = list(Page.TB_XPATH_ID(self.page_tree))
         return self.page_blocks_id
 
     @property
@@ -157,17 +370,40 @@ class Page(object):
         :return: images
         :rtype: list(lxml.etree._Element)
         """
-        if not self.page_images:
-            self.page_images = self.query(Page.IMAGES_XPATH)
+        if self.page_images is None:
+            if self.tree is None:
+                self.parse_tree()
+            self.page_images = Page.IMAGES_XPATH(self.page_tree)
         return self.page_images
 
+    def content_iter(self):
+        """
+        Iterate over words in page, without building the list of
+        words if it has not already been built.
+
+        :return: word
+        :rtype: str or unicode
+        """
+        if self.page_words is not None:
+            yield from self.page_words
+            return
+        if self.tree is None:
+            self.parse_tree()
+        for string in self.page_tree.iter("String"):
+            word = string.get("CONTENT")
+            if word is not None:
+                yield word
+
     @property
     def content(self):
         """
         Gets all words in page and contatenates together using ' ' as
-        delimiter.
+        delimiter. This is then saved in an attribute, so the content
+        is only built once.
 
         :return: content
         :rtype: str or unicode
         """
-        return " ".join(self.words)
+        if self.page_content is None:
+            self.page_content = " ".join(self.words)
+        return self.page_content
@@ -58,6 +58,7 @@ def do_query(archives, config_file=None, logger=None, context=None):
     data_file = query_utils.extract_data_file(config, os.path.dirname(config_file))
 
     keywords = query_utils.get_normalized_keywords(data_file, preprocess_type)
+    keywords_bc = context.broadcast(keywords)
 
     # [document, ...]
     documents = archives.flatMap(
@@ -65,7 +66,9 @@ def do_query(archives, config_file=None, logger=None, context=None):
     )
 
     filtered_words = documents.flatMap(
-        lambda document: get_article_matches(document, keywords, preprocess_type)
+        lambda document: get_article_matches(
+            document, keywords_bc.value, preprocess_type
+        )
     )
 
     # [(year, document, article, textblock_id, textblock_coords, textblock_page_area, words, page_name, keyword), ....]
@@ -97,5 +100,6 @@ def do_query(archives, config_file=None, logger=None, context=None):
         .map(lambda word_context: (word_context[0], list(word_context[1])))
         .collect()
     )
+    keywords_bc.unpersist()
 
     return result
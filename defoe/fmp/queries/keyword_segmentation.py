@@ -62,21 +62,25 @@ def do_query(archives, config_file=None, logger=None, context=None):
     preprocess_type = query_utils.extract_preprocess_word_type(config)
     data_file = query_utils.extract_data_file(config, os.path.dirname(config_file))
     year_min, year_max = query_utils.extract_years_filter(config)
+    year_min, year_max = int(year_min), int(year_max)
     output_path = query_utils.extract_output_path(config)
 
     keywords = query_utils.get_normalized_keywords(data_file, preprocess_type)
+    keywords_bc = context.broadcast(keywords)
 
     # [document, ...]
     documents = archives.flatMap(
         lambda archive: [
             document
             for document in list(archive)
-            if document.year >= int(year_min) and document.year <= int(year_max)
+            if year_min <= document.year <= year_max
         ]
     )
 
     filtered_words = documents.flatMap(
-        lambda document: get_article_matches(document, keywords, preprocess_type)
+        lambda document: get_article_matches(
+            document, keywords_bc.value, preprocess_type
+        )
     )
 
     # [(year, document, article, textblock_id, textblock_coords, textblock_page_area, words, preprocessed_words, page_name, keyword), ....]
@@ -118,5 +122,6 @@ def do_query(archives, config_file=None, logger=None, context=None):
         .map(lambda word_context: (word_context[0], list(word_context[1])))
         .collect()
     )
+    keywords_bc.unpersist()
 
     return result
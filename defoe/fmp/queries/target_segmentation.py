@@ -67,6 +67,7 @@ def do_query(archives, config_file=None, logger=None, context=None):
     preprocess_type = query_utils.extract_preprocess_word_type(config)
     data_file = query_utils.extract_data_file(config, os.path.dirname(config_file))
     year_min, year_max = query_utils.extract_years_filter(config)
+    year_min, year_max = int(year_min), int(year_max)
     output_path = query_utils.extract_output_path(config)
 
     with open(data_file, "r") as f:
@@ -81,6 +82,9 @@ def do_query(archives, config_file=None, logger=None, context=None):
     # The rest of words of the lexicon are selected as keywords
     keywords = keywords[2:]
 
+    target_words_bc = context.broadcast(target_words)
+    keywords_bc = context.broadcast(keywords)
+
     # We will select/filter the textblocks that follows this rule: The text contains at least one target words AND one keyword.
 
     # [document, ...]
@@ -88,15 +92,19 @@ def do_query(archives, config_file=None, logger=None, context=None):
         lambda archive: [
             document
             for document in list(archive)
-            if document.year >= int(year_min) and document.year <= int(year_max)
+            if year_min <= document.year <= year_max
         ]
     )
 
     filtered_tb = documents.flatMap(
-        lambda document: get_article_matches(document, target_words, preprocess_type)
+        lambda document: get_article_matches(
+            document, target_words_bc.value, preprocess_type
+        )
     )
 
-    filtered_words = filtered_tb.flatMap(lambda tb: get_tb_matches(tb, keywords))
+    filtered_words = filtered_tb.flatMap(
+        lambda tb: get_tb_matches(tb, keywords_bc.value)
+    )
 
     # [(year, document, article, textblock_id, textblock_coords, textblock_page_area, words, preprocessed_words, page_name, keyword,target), ....]
     # [(word, {"article_id": article_id, ...}), ...]
@@ -138,5 +146,7 @@ def do_query(archives, config_file=None, logger=None, context=None):
         .map(lambda word_context: (word_context[0], list(word_context[1])))
         .collect()
     )
+    target_words_bc.unpersist()
+    keywords_bc.unpersist()
 
     return result
@@ -2,8 +2,6 @@
 Counts total number of pages.
 """
 
-from operator import add
-
 
 def do_query(archives, config_file=None, logger=None, context=None):
     """
@@ -30,11 +28,12 @@ def do_query(archives, config_file=None, logger=None, context=None):
     # [archive, archive, ...]
     documents = archives.flatMap(lambda archive: list(archive))
 
-    print("num documents %s" % documents.count())
-
-    # [num_articles, num_articles, ...]
-    num_articles = documents.map(lambda document: document.num_articles)
-
-    result = [documents.count(), num_articles.reduce(add)]
+    # (num_documents, num_articles)
+    num_documents, num_articles = documents.treeAggregate(
+        (0, 0),
+        lambda counts, document: (counts[0] + 1, counts[1] + document.num_articles),
+        lambda counts, other: (counts[0] + other[0], counts[1] + other[1]),
+        depth=2,
+    )
 
-    return {"num_documents": result[0], "num_articles": result[1]}
+    return {"num_documents": num_documents, "num_articles": num_articles}
@@ -174,6 +174,7 @@ def do_query(archives, config_file=None, logger=None, context=None):
     preprocess_type = query_utils.extract_preprocess_word_type(config)
     data_file = query_utils.extract_data_file(config, os.path.dirname(config_file))
     year_min, year_max = query_utils.extract_years_filter(config)
+    year_min, year_max = int(year_min), int(year_max)
     output_path = query_utils.extract_output_path(config)
 
     input_words = query_utils.get_config(data_file)
@@ -191,18 +192,21 @@ def do_query(archives, config_file=None, logger=None, context=None):
         ]
     )
 
+    target_words_bc = context.broadcast(target_words)
+    keywords_bc = context.broadcast(keywords)
+
     # retrieve the documents from each archive
     documents = archives.flatMap(
         lambda archive: [
-            document
-            for document in archive
-            if int(year_min) <= document.year <= int(year_max)
+            document for document in archive if year_min <= document.year <= year_max
         ]
     )
 
     # find textblocks that contain pairs of (target word, keyword) and record their distance
     filtered_words = documents.flatMap(
-        lambda document: find_words(document, target_words, keywords, preprocess_type)
+        lambda document: find_words(
+            document, target_words_bc.value, keywords_bc.value, preprocess_type
+        )
     )
 
     # create the output dictionary
@@ -256,5 +260,7 @@ def do_query(archives, config_file=None, logger=None, context=None):
         )
         .collect()
     )
+    target_words_bc.unpersist()
+    keywords_bc.unpersist()
 
     return result
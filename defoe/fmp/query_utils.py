@@ -317,12 +317,11 @@ def calculate_words_confidence_average(page):
     :rtype: list(str or unicode)
     """
 
-    total_wc = 0
-    for wc in page.wc:
-        total_wc += float(wc)
+    page_wc = page.wc
+    total_wc = sum(map(float, page_wc))
 
     try:
-        calculate_wc = str(total_wc / len(page.wc))
+        calculate_wc = str(total_wc / len(page_wc))
     except:
         calculate_wc = "0"
 
@@ -18,7 +18,7 @@ def filename_to_object(filename):
     :rtype: tuple(defoe.fmp.archive.Archive | str or unicode, str or unicode)
     """
     try:
-        result = (Archive(filename), None)
+        result = (Archive(filename, retain_tree=False), None)
     except Exception as exception:
         result = (filename, str(exception))
 
@@ -10,6 +10,21 @@ class TextBlock(object):
     in METS/MODS format.
     """
 
+    __slots__ = (
+        "textblock_tree",
+        "textblock_words",
+        "textblock_strings",
+        "textblock_images",
+        "textblock_wc",
+        "textblock_cc",
+        "textblock_shape",
+        "textblock_coords",
+        "textblock_page_area",
+        "textblock_id",
+        "page_name",
+    )
+    """ TextBlock attributes. TextBlocks have no __dict__ """
+
     # XPath Queries
     STRINGS_XPATH = "TextLine/String"  # String elements
     WC_XPATH = "TextLine/String/@WC"  # Word confidence content
@@ -42,9 +57,9 @@ class TextBlock(object):
         :return: words
         :rtype: list(str or unicode)
         """
-        if not self.textblock_words:
-            self.textblock_words = list(
-                map(str, self.textblock_tree.xpath(TextBlock.WORDS_XPATH))
+        if self.textblock_words is None:
+            self.textblock_words = self.textblock_tree.xpath(
+                TextBlock.WORDS_XPATH, smart_strings=False
             )
         return self.textblock_words
 
@@ -57,8 +72,10 @@ class TextBlock(object):
         :return: wc
         :rtype: list(str)
         """
-        if not self.textblock_wc:
-            self.textblock_wc = list(self.textblock_tree.xpath(TextBlock.WC_XPATH))
+        if self.textblock_wc is None:
+            self.textblock_wc = self.textblock_tree.xpath(
+                TextBlock.WC_XPATH, smart_strings=False
+            )
         return self.textblock_wc
 
     @property
@@ -70,8 +87,10 @@ class TextBlock(object):
         :return: cc
         :rtype: list(str)
         """
-        if not self.textblock_cc:
-            self.textblock_cc = list(self.textblock_tree.xpath(TextBlock.CC_XPATH))
+        if self.textblock_cc is None:
+            self.textblock_cc = self.textblock_tree.xpath(
+                TextBlock.CC_XPATH, smart_strings=False
+            )
 
         return self.textblock_cc
 
@@ -84,7 +103,7 @@ class TextBlock(object):
         :return: strings
         :rtype: list(lxml.etree._ElementStringResult)
         """
-        if not self.textblock_strings:
+        if self.textblock_strings is None:
             self.textblock_strings = self.textblock_tree.xpath(TextBlock.STRINGS_XPATH)
         return self.textblock_strings
 
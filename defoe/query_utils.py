@@ -9,11 +9,19 @@ from nltk.stem import PorterStemmer, WordNetLemmatizer
 
 from lxml import etree
 import enum
+import hashlib
+import json
 import os
 import re
 import subprocess
+import tempfile
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 NON_AZ_REGEXP = re.compile("[^a-z]")
 NON_AZ_19_REGEXP = re.compile("[^a-z0-9]")
@@ -794,10 +802,48 @@ def create_es_index(es_index, force_creation):
         return created
 
 
+CONFIG_CACHE_DIR_VARIABLE = "DEFOE_CONFIG_CACHE_DIR"
+""" Environment variable naming a directory to cache parsed configs in """
+CONFIG_CACHE_EXTENSIONS = (".yml", ".yaml")
+""" Extensions of configuration files whose parsed content is cached """
+
+
 def get_config(config_file, optional=False):
+    """
+    Load a YAML query configuration file.
+
+    If the environment variable named by CONFIG_CACHE_DIR_VARIABLE is
+    set, and config_file has one of CONFIG_CACHE_EXTENSIONS, then the
+    parsed configuration is cached as JSON in that directory. The
+    cache is reused only while the modification time and size of
+    config_file are exactly those recorded in the cache.
+
+    :param config_file: YAML configuration file
+    :type config_file: str or unicode
+    :param optional: if True return an empty dictionary if the file
+    does not exist
+    :type optional: bool
+    :return: configuration
+    :rtype: dict
+    :raises: FileNotFoundError if the file does not exist and
+    optional is False
+    """
     try:
         with open(config_file, "r") as f:
-            return yaml.safe_load(f)
+            cache_file = get_config_cache_file(config_file)
+            if cache_file is None:
+                return yaml.load(f, Loader=YamlLoader)
+            stat = os.fstat(f.fileno())
+            source = {
+                "path": os.path.abspath(config_file),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+            }
+            config = read_config_cache(cache_file, source)
+            if config is None:
+                config = yaml.load(f, Loader=YamlLoader)
+                write_config_cache(config, source, cache_file)
+            return config
     except FileNotFoundError as e:
         if optional:
             return {}
@@ -805,6 +851,91 @@ def get_config(config_file, optional=False):
         raise FileNotFoundError(e)
 
 
+def get_config_cache_file(config_file):
+    """
+    Get the file in which to cache the parsed content of a YAML
+    configuration file.
+
+    :param config_file: YAML configuration file
+    :type config_file: str or unicode
+    :return: cache file, or None if caching is not enabled or
+    config_file does not have one of CONFIG_CACHE_EXTENSIONS
+    :rtype: str or unicode
+    """
+    cache_dir = os.environ.get(CONFIG_CACHE_DIR_VARIABLE)
+    if not cache_dir:
+        return None
+    if os.path.splitext(config_file)[1].lower() not in CONFIG_CACHE_EXTENSIONS:
+        return None
+    path = os.path.abspath(config_file).encode("utf-8", "surrogateescape")
+    return os.path.join(cache_dir, hashlib.sha1(path).hexdigest() + ".json")
+
+
+def read_config_cache(cache_file, source):
+    """
+    Read a parsed configuration from a JSON cache file.
+
+    :param cache_file: JSON cache file
+    :type cache_file: str or unicode
+    :param source: path, modification time (ns) and size of the
+    configuration file
+    :type source: dict
+    :return: configuration, or None if there is no cache file or it
+    was written for a different path, modification time or size
+    :rtype: dict
+    """
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("source") != source:
+        return None
+    return cache.get("config")
+
+
+def write_config_cache(config, source, cache_file):
+    """
+    Atomically write a parsed configuration to a JSON cache file,
+    together with the path, modification time and size of the
+    configuration file it was parsed from.
+
+    Nothing is written if the configuration does not survive a JSON
+    round trip unchanged (e.g. it has dates or non-string keys) or if
+    the cache file cannot be written.
+
+    :param config: configuration
+    :type config: dict
+    :param source: path, modification time (ns) and size of the
+    configuration file
+    :type source: dict
+    :param cache_file: JSON cache file
+    :type cache_file: str or unicode
+    """
+    try:
+        if json.loads(json.dumps(config)) != config:
+            return
+        serialized = json.dumps({"source": source, "config": config})
+    except (TypeError, ValueError):
+        return
+
+    cache_dir = os.path.dirname(cache_file)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(serialized)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
 def get_normalized_keywords(config_file, preprocess_type=PreprocessWordType.NONE):
     with open(config_file, "r") as f:
         if preprocess_type:
@@ -0,0 +1,330 @@
+"""
+defoe.fmp.document.Document tests.
+"""
+
+from io import BytesIO
+from unittest import TestCase
+
+from lxml import etree
+
+from defoe.fmp.archive import Archive
+from defoe.fmp.document import Document
+from defoe.file_utils import get_path
+from defoe.test.fmp import fixtures
+
+EMPTY_FIRST_MODS = b"""<mets:mets xmlns:mets="http://www.loc.gov/METS/"
+    xmlns:mods="http://www.loc.gov/mods/v3">
+  <mods:title>Outside dmdSec</mods:title>
+  <mets:dmdSec ID="dmd0001">
+    <mods:mods>
+      <mods:title/>
+      <mods:title>The Test Gazette</mods:title>
+      <mods:publisher></mods:publisher>
+      <mods:dateIssued/>
+      <mods:dateIssued>1901-01-01</mods:dateIssued>
+    </mods:mods>
+  </mets:dmdSec>
+</mets:mets>
+"""
+""" METS/MODS metadata with empty MODS elements before non-empty ones """
+
+
+class TestDocument(TestCase):
+    """
+    defoe.fmp.document.Document tests.
+    """
+
+    def setUp(self):
+        """
+        Creates Archive from test directory fixtures/0000164_19010101
+        then retrieves first Document.
+        """
+        source = get_path(fixtures, "0000164_19010101")
+        self.archive = Archive(source)
+        self.document = self.archive[0]
+
+    def test_metadata(self):
+        """
+        Tests Document metadata attributes hold the expected values.
+        """
+        self.assertEqual("The Test Gazette", self.document.title)
+        self.assertEqual("Test Publishing Company", self.document.publisher)
+        self.assertEqual("London", self.document.place)
+        self.assertEqual("1901-01-01", self.document.date)
+        self.assertEqual("0000164_19010101", self.document.documentId)
+        self.assertEqual([1901], self.document.years)
+        self.assertEqual(1901, self.document.year)
+
+    def test_page_codes(self):
+        """
+        Tests Document.page_codes attribute holds the expected page
+        codes in order.
+        """
+        self.assertEqual(["0001", "0002"], list(self.document.page_codes))
+        self.assertEqual(2, self.document.num_pages)
+
+    def test_page_reuse(self):
+        """
+        Tests Document returns the same Page object each time a page
+        is requested, and a new one after the page is released.
+        """
+        page = self.document[0]
+        self.assertIs(page, self.document[0])
+        self.assertIs(page, next(iter(self.document)))
+        self.document.release_page(page.code)
+        self.assertIsNot(page, self.document[0])
+
+    def test_words(self):
+        """
+        Tests Document.words returns words from all pages.
+        """
+        words = list(self.document.words())
+        self.assertEqual(15, len(words))
+        self.assertEqual(["GREAT", "FIRE", "IN", "LONDON"], words[:4])
+        self.assertEqual("PRICES", words[-1])
+
+    def test_num_articles(self):
+        """
+        Tests Document.num_articles holds the expected number of
+        articles.
+        """
+        self.assertEqual(2, self.document.num_articles)
+
+    def test_articles(self):
+        """
+        Tests Document.articles maps articles to their textblocks,
+        with textblock shapes, coordinates and page areas set.
+        """
+        articles = self.document.articles
+        self.assertEqual(["art0001", "art0002"], sorted(articles))
+        self.assertEqual(
+            ["pa0001001", "pa0001002", "pa0002001"],
+            [tb.textblock_id for tb in articles["art0001"]],
+        )
+        tb = articles["art0002"][0]
+        self.assertEqual("pa0002002", tb.textblock_id)
+        self.assertEqual("RECT", tb.textblock_shape)
+        self.assertEqual("950,100,1900,500", tb.textblock_coords)
+        self.assertEqual("page2 area2", tb.textblock_page_area)
+        self.assertEqual(["MARKET", "PRICES"], tb.words)
+
+    def test_articles_repeated(self):
+        """
+        Tests Document.articles returns the same articles when
+        accessed more than once.
+        """
+        first = self.document.articles
+        second = self.document.articles
+        self.assertEqual(
+            {art: [tb.textblock_id for tb in tbs] for art, tbs in first.items()},
+            {art: [tb.textblock_id for tb in tbs] for art, tbs in second.items()},
+        )
+        self.assertEqual("page1 area1", second["art0001"][0].textblock_page_area)
+
+    def test_word_records(self):
+        """
+        Tests Document.word_records returns each word with its word
+        and character confidences.
+        """
+        records = list(self.document.word_records())
+        self.assertEqual(list(self.document.words()), [r[0] for r in records])
+        self.assertEqual(list(self.document.wc()), [r[1] for r in records])
+        self.assertEqual(list(self.document.cc()), [r[2] for r in records])
+        self.assertEqual(("GREAT", "0.91", "90800"), records[0])
+
+    def test_articles_info(self):
+        """
+        Tests Document.articles_info returns shape, coordinates and
+        page area for each part and leaves Document.partsCoord as it
+        was, however often it is called.
+        """
+        self.document.articles_info()
+        info = self.document.articles_info()
+        self.assertEqual(
+            ["RECT", "100,100,900,400", "page1 area1"], info["art0001"]["pa0001001"]
+        )
+        self.assertEqual(
+            ["RECT", "100,100,900,400"], self.document.partsCoord["pa0001001"]
+        )
+
+    def test_query(self):
+        """
+        Tests Document.query and Document.single_query with XPath
+        query strings using METS/MODS namespace prefixes.
+        """
+        self.assertEqual(
+            ["0000164_19010101"], self.document.query("//mods:identifier/text()")
+        )
+        self.assertEqual(
+            "London", self.document.single_query("//mods:placeTerm/text()")
+        )
+        self.assertEqual(None, self.document.single_query("//mods:note/text()"))
+
+    def test_parse_year(self):
+        """
+        Tests Document.parse_year extracts years from dates and year
+        ranges.
+        """
+        self.assertEqual([1861, 1862], Document.parse_year("1862, [1861]"))
+        self.assertEqual([1846, 1847], Document.parse_year("1847 [1846, 47]"))
+        self.assertEqual([1873, 1880], Document.parse_year("1873-80"))
+        self.assertEqual([1870], Document.parse_year("1870-09-01"))
+        self.assertEqual([], Document.parse_year("London"))
+        self.assertEqual([], Document.parse_year(None))
+        self.assertEqual([], Document.parse_year(""))
+
+    def test_parse_year_repeated(self):
+        """
+        Tests Document.parse_year returns a new list each time it is
+        called with the same text.
+        """
+        years = Document.parse_year("1873-80")
+        years.append(1900)
+        self.assertEqual([1873, 1880], Document.parse_year("1873-80"))
+
+    def test_articles_reuse_pages(self):
+        """
+        Tests Document.articles holds the same TextBlock objects as
+        the document's pages, so pages are not parsed again.
+        """
+        articles = self.document.articles
+        self.assertIs(self.document[1].tb[1], articles["art0002"][0])
+
+    def test_metadata_tree(self):
+        """
+        Tests Document.metadata_tree keeps structural metadata but not
+        the file list, and Document.query runs over metadata_tree.
+        """
+        tree = self.document.metadata_tree
+        self.assertEqual(
+            2, len(tree.findall("mets:structMap", self.document.NAMESPACES))
+        )
+        self.assertEqual([], tree.findall(".//mets:FLocat", self.document.NAMESPACES))
+        self.assertEqual([], self.document.query("//mets:FLocat/@xlink:href"))
+        self.assertEqual(
+            ["PHYSICAL", "LOGICAL"], self.document.query("//mets:structMap/@TYPE")
+        )
+
+    def test_clean_id(self):
+        """
+        Tests Document.clean_id removes non-alphanumeric characters.
+        """
+        self.assertEqual("pa0001001", Document.clean_id("#pa0001001"))
+        self.assertEqual("art0001", Document.clean_id("art0001"))
+        self.assertEqual("pa0001001", Document.clean_id("#pa-0001_001"))
+        self.assertEqual("", Document.clean_id("#"))
+
+    def test_structure_lazy(self):
+        """
+        Tests Document structural information is only parsed when
+        first requested.
+        """
+        self.assertIsNone(self.document._partsCoord)
+        self.assertIsNone(self.document._articlesId)
+        self.assertEqual(
+            ["RECT", "950,100,1900,800"], self.document.partsCoord["pa0001003"]
+        )
+        self.assertEqual("page1 area3", self.document.partsPage["pa0001003"])
+        self.assertEqual(["pa0001003"], self.document.articlesParts["ad0001"])
+        self.assertEqual(["art0001", "art0002"], self.document.articlesId)
+
+    def test_load_pages(self):
+        """
+        Tests Document.load_pages creates all pages, which are then
+        returned by page requests.
+        """
+        first = self.document[0]
+        self.document.load_pages(max_workers=2)
+        self.assertIs(first, self.document[0])
+        pages = list(self.document)
+        self.assertEqual(["0001", "0002"], [page.code for page in pages])
+        self.assertIs(pages[1], self.document[1])
+        self.assertEqual(["MARKET", "PRICES"], pages[1].words[-2:])
+
+    def test_parts_info(self):
+        """
+        Tests Document.parts_info returns article, shape, coordinates
+        and page area for each part of an article.
+        """
+        info = self.document.parts_info()
+        self.assertEqual(
+            [("art0001", "RECT", "100,100,900,400", "page1 area1")],
+            info["pa0001001"],
+        )
+        self.assertFalse("pa0001003" in info)
+        self.assertEqual(4, len(info))
+
+    def test_retain_tree(self):
+        """
+        Tests Document created with retain_tree False releases the
+        METS/MODS tree but still has its articles and can be queried.
+        """
+        source = get_path(fixtures, "0000164_19010101")
+        document = Archive(source, retain_tree=False)[0]
+        self.assertIsNone(document.metadata_tree)
+        self.assertEqual("The Test Gazette", document.title)
+        self.assertEqual(["art0001", "art0002"], sorted(document.articles))
+        self.assertEqual("London", document.single_query("//mods:placeTerm/text()"))
+        self.assertEqual([], document.query("//mets:FLocat/@xlink:href"))
+        self.assertIsNone(document.metadata_tree)
+
+    def test_parse_mods_skips_empty(self):
+        """
+        Tests Document.parse_mods skips MODS elements with no text and
+        returns the text of the first element that has text.
+        """
+        self.document.metadata_tree = etree.ElementTree(
+            etree.fromstring(EMPTY_FIRST_MODS)
+        )
+        mods = self.document.parse_mods()
+        self.assertEqual("The Test Gazette", mods[Document.TITLE_TAG])
+        self.assertEqual("1901-01-01", mods[Document.DATE_TAG])
+        self.assertNotIn(Document.PUBLISHER_TAG, mods)
+
+    def test_batch_metadata(self):
+        """
+        Tests Document.batch_metadata returns the same metadata as
+        Document.
+        """
+        metadata = Document.batch_metadata(self.archive)
+        self.assertEqual(1, len(metadata))
+        document = metadata[0]
+        self.assertEqual("0000164_19010101", document["code"])
+        self.assertEqual(self.document.title, document["title"])
+        self.assertEqual(self.document.publisher, document["publisher"])
+        self.assertEqual(self.document.place, document["place"])
+        self.assertEqual(self.document.date, document["date"])
+        self.assertEqual(self.document.documentId, document["documentId"])
+        self.assertEqual(self.document.years, document["years"])
+        self.assertEqual(self.document.year, document["year"])
+        self.assertEqual(self.document.page_codes, document["page_codes"])
+        self.assertEqual(2, document["num_pages"])
+
+    def test_read_mods(self):
+        """
+        Tests Document.read_mods only reads MODS elements within
+        dmdSecs and skips MODS elements with no text.
+        """
+        mods = Document.read_mods(BytesIO(EMPTY_FIRST_MODS))
+        self.assertEqual("The Test Gazette", mods[Document.TITLE_TAG])
+        self.assertEqual("1901-01-01", mods[Document.DATE_TAG])
+        self.assertNotIn(Document.PUBLISHER_TAG, mods)
+
+    def test_slots(self):
+        """
+        Tests Document has no __dict__, so no attributes other than
+        those it declares can be set.
+        """
+        self.assertFalse(hasattr(self.document, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.document.unknown = None
+
+    def test_fast_pages(self):
+        """
+        Tests Document created with fast_pages True reads its pages'
+        words without parsing the pages' trees.
+        """
+        document = Document(self.document.code, self.archive, fast_pages=True)
+        self.assertEqual(list(self.document.words()), list(document.words()))
+        self.assertEqual(list(self.document.wc()), list(document.wc()))
+        self.assertEqual([None, None], [page.tree for page in document])
@@ -0,0 +1,185 @@
+"""
+defoe.fmp.page.Page tests.
+"""
+
+from unittest import TestCase
+
+from defoe.fmp.archive import Archive
+from defoe.fmp.page import Page
+from defoe.file_utils import get_path
+from defoe.test.fmp import fixtures
+
+
+class TestPage(TestCase):
+    """
+    defoe.fmp.page.Page tests.
+    """
+
+    def setUp(self):
+        """
+        Creates Archive from test directory fixtures/0000164_19010101
+        then retrieves the first Page of the first Document.
+        """
+        source = get_path(fixtures, "0000164_19010101")
+        self.document = Archive(source)[0]
+        self.page = self.document[0]
+
+    def test_dimensions(self):
+        """
+        Tests Page width, height and page confidence.
+        """
+        self.assertEqual(2000, self.page.width)
+        self.assertEqual(3000, self.page.height)
+        self.assertEqual("0.85", self.page.pc)
+
+    def test_words(self):
+        """
+        Tests Page.words property returns expected words.
+        """
+        self.assertEqual(10, len(self.page.words))
+        for word in ["GREAT", "FIRE", "SOAP"]:
+            self.assertTrue(word in self.page.words)
+
+    def test_strings_count(self):
+        """
+        Tests Page.strings property returns expected number of strings.
+        """
+        self.assertEqual(10, len(self.page.strings))
+
+    def test_confidences(self):
+        """
+        Tests Page.wc and Page.cc properties return one value per
+        word.
+        """
+        self.assertEqual(10, len(self.page.wc))
+        self.assertEqual("0.91", self.page.wc[0])
+        self.assertEqual(10, len(self.page.cc))
+        self.assertEqual("90800", self.page.cc[0])
+
+    def test_strings_parsed_once(self):
+        """
+        Tests Page strings, words and confidences are retrieved
+        together, as plain strings.
+        """
+        self.assertEqual("GREAT", self.page.words[0])
+        self.assertEqual(10, len(self.page.page_strings))
+        self.assertEqual(10, len(self.page.page_wc))
+        self.assertEqual(10, len(self.page.page_cc))
+        self.assertIs(str, type(self.page.wc[0]))
+
+    def test_textblocks(self):
+        """
+        Tests Page.tb and Page.textblock_ids hold the page's
+        textblocks.
+        """
+        self.assertEqual(
+            ["pa0001001", "pa0001002", "pa0001003"], self.page.textblock_ids
+        )
+        self.assertEqual(
+            ["pa0001001", "pa0001002", "pa0001003"],
+            [tb.textblock_id for tb in self.page.tb],
+        )
+        self.assertEqual(["BUY", "SOAP"], self.page.tb[2].words)
+        self.assertIs(str, type(self.page.tb[2].words[0]))
+        self.assertEqual(["0.97", "0.96"], self.page.tb[2].wc)
+
+    def test_textblocks_lazy(self):
+        """
+        Tests Page.tb is only retrieved when first requested, and then
+        the same textblocks are returned.
+        """
+        self.assertIsNone(self.page.page_tb)
+        tbs = self.page.tb
+        self.assertIs(tbs, self.page.tb)
+        self.assertEqual("0000164_19010101_0001.xml", tbs[0].page_name)
+
+    def test_textblock_ids_from_textblocks(self):
+        """
+        Tests Page.textblock_ids uses the page's textblocks if these
+        have already been retrieved.
+        """
+        tbs = self.page.tb
+        self.assertEqual([tb.textblock_id for tb in tbs], self.page.textblock_ids)
+        self.assertIs(str, type(self.page.textblock_ids[0]))
+
+    def test_images_count(self):
+        """
+        Tests Page.images property returns expected number of images.
+        """
+        self.assertEqual(0, len(self.page.images))
+        self.assertIsNotNone(self.page.page_images)
+        self.assertEqual(1, len(self.document[1].images))
+
+    def test_content_iter(self):
+        """
+        Tests Page.content_iter returns page words without building
+        the list of words, and returns the same words afterwards.
+        """
+        words = list(self.page.content_iter())
+        self.assertIsNone(self.page.page_words)
+        self.assertEqual(self.page.words, words)
+        self.assertEqual(words, list(self.page.content_iter()))
+
+    def test_content(self):
+        """
+        Tests Page.content property returns text which includes an
+        expected phrase.
+        """
+        self.assertTrue("GREAT FIRE IN LONDON" in self.page.content)
+        self.assertIs(self.page.content, self.page.content)
+
+    def test_fast(self):
+        """
+        Tests Page created with fast True reads the same dimensions,
+        words, confidences and textblock IDs without parsing a tree,
+        then parses the tree when strings are requested.
+        """
+        page = Page(self.document, "0001", fast=True)
+        self.assertIsNone(page.tree)
+        self.assertEqual(
+            (self.page.width, self.page.height, self.page.pc),
+            (page.width, page.height, page.pc),
+        )
+        self.assertEqual(self.page.words, page.words)
+        self.assertEqual(self.page.wc, page.wc)
+        self.assertEqual(self.page.cc, page.cc)
+        self.assertEqual(self.page.textblock_ids, page.textblock_ids)
+        self.assertIsNone(page.tree)
+        self.assertEqual(10, len(page.strings))
+        self.assertEqual(["BUY", "SOAP"], page.tb[2].words)
+
+    def test_fast_word_records(self):
+        """
+        Tests Page created with fast True returns the same word
+        records without parsing a tree.
+        """
+        page = Page(self.document, "0001", fast=True)
+        self.assertEqual(
+            list(self.page.iter_word_records()), list(page.iter_word_records())
+        )
+        self.assertIsNone(page.tree)
+
+    def test_metadata_only(self):
+        """
+        Tests Page created with metadata_only True reads dimensions
+        and textblock IDs only, then reads words from the tree if
+        requested.
+        """
+        page = Page(self.document, "0001", metadata_only=True)
+        self.assertEqual(
+            (self.page.width, self.page.height, self.page.pc),
+            (page.width, page.height, page.pc),
+        )
+        self.assertEqual(self.page.textblock_ids, page.textblock_ids)
+        self.assertIsNone(page.page_words)
+        self.assertIsNone(page.tree)
+        self.assertEqual(self.page.words, page.words)
+
+    def test_slots(self):
+        """
+        Tests Page has no __dict__, so no attributes other than those
+        it declares can be set.
+        """
+        self.assertFalse(hasattr(self.page, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.page.unknown = None
@@ -0,0 +1,165 @@
+"""
+defoe.query_utils configuration loading tests.
+"""
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from defoe import query_utils
+
+
+class TestGetConfig(TestCase):
+    """
+    defoe.query_utils.get_config tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a temporary directory with a YAML configuration file
+        and enables caching in a cache directory within it.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, "cache")
+        self.config_file = os.path.join(self.directory, "query.yml")
+        self.write_config("preprocess: normalize\n")
+        environ = patch.dict(
+            os.environ, {query_utils.CONFIG_CACHE_DIR_VARIABLE: self.cache_dir}
+        )
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+        """
+        shutil.rmtree(self.directory)
+
+    def write_config(self, content, mtime_ns=None):
+        """
+        Writes the configuration file, optionally setting its
+        modification time.
+        """
+        with open(self.config_file, "w") as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(self.config_file, ns=(mtime_ns, mtime_ns))
+
+    def cache_file(self):
+        """
+        Gets the cache file for the configuration file.
+        """
+        return query_utils.get_config_cache_file(self.config_file)
+
+    def test_cache_hit(self):
+        """
+        Tests get_config writes a cache file in the cache directory
+        and reads the configuration from it while the configuration
+        file is unchanged.
+        """
+        self.assertEqual(
+            {"preprocess": "normalize"}, query_utils.get_config(self.config_file)
+        )
+        self.assertEqual(os.path.dirname(self.cache_file()), self.cache_dir)
+        with open(self.cache_file()) as f:
+            cache = json.load(f)
+        cache["config"] = {"preprocess": "cached"}
+        with open(self.cache_file(), "w") as f:
+            json.dump(cache, f)
+        self.assertEqual(
+            {"preprocess": "cached"}, query_utils.get_config(self.config_file)
+        )
+        self.assertEqual(["cache", "query.yml"], sorted(os.listdir(self.directory)))
+
+    def test_invalidated_by_mtime(self):
+        """
+        Tests the cache is not used once the configuration file is
+        replaced by one of the same size with an older modification
+        time.
+        """
+        mtime_ns = os.stat(self.config_file).st_mtime_ns
+        query_utils.get_config(self.config_file)
+        self.write_config("preprocess: stem_word\n", mtime_ns - 10**9)
+        self.assertEqual(
+            {"preprocess": "stem_word"}, query_utils.get_config(self.config_file)
+        )
+
+    def test_invalidated_by_size(self):
+        """
+        Tests the cache is not used once the configuration file is
+        replaced by one of a different size with the same
+        modification time.
+        """
+        mtime_ns = os.stat(self.config_file).st_mtime_ns
+        query_utils.get_config(self.config_file)
+        self.write_config("preprocess: stem\n", mtime_ns)
+        self.assertEqual(
+            {"preprocess": "stem"}, query_utils.get_config(self.config_file)
+        )
+
+    def test_not_json(self):
+        """
+        Tests a configuration that does not survive a JSON round trip
+        is returned as parsed and not cached.
+        """
+        self.write_config("date: 1901-01-01\n1: one\n")
+        self.assertEqual(
+            {"date": datetime.date(1901, 1, 1), 1: "one"},
+            query_utils.get_config(self.config_file),
+        )
+        self.assertFalse(os.path.exists(self.cache_file()))
+
+    def test_unwritable_cache_dir(self):
+        """
+        Tests get_config loads the configuration without raising if
+        the cache directory cannot be created.
+        """
+        blocker = os.path.join(self.directory, "blocker")
+        with open(blocker, "w") as f:
+            f.write("")
+        with patch.dict(
+            os.environ,
+            {query_utils.CONFIG_CACHE_DIR_VARIABLE: os.path.join(blocker, "cache")},
+        ):
+            self.assertEqual(
+                {"preprocess": "normalize"}, query_utils.get_config(self.config_file)
+            )
+            self.assertFalse(os.path.exists(self.cache_file()))
+
+    def test_not_yaml_file(self):
+        """
+        Tests files without a YAML extension are not cached.
+        """
+        data_file = os.path.join(self.directory, "words.txt")
+        with open(data_file, "w") as f:
+            f.write("heart\n")
+        self.assertEqual("heart", query_utils.get_config(data_file))
+        self.assertIsNone(query_utils.get_config_cache_file(data_file))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_disabled(self):
+        """
+        Tests nothing is cached if the cache directory environment
+        variable is not set.
+        """
+        with patch.dict(os.environ):
+            del os.environ[query_utils.CONFIG_CACHE_DIR_VARIABLE]
+            self.assertEqual(
+                {"preprocess": "normalize"}, query_utils.get_config(self.config_file)
+            )
+            self.assertIsNone(self.cache_file())
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_optional(self):
+        """
+        Tests a missing optional configuration file gives an empty
+        configuration and a missing required one raises an error.
+        """
+        missing = os.path.join(self.directory, "missing.yml")
+        self.assertEqual({}, query_utils.get_config(missing, optional=True))
+        with self.assertRaises(FileNotFoundError):
+            query_utils.get_config(missing)